@@ -1,12 +1,17 @@
 from __future__ import annotations
 
-from datetime import datetime, timezone
+import asyncio
+import os
+import time
+from dataclasses import dataclass, field
 from hashlib import sha256
 from pathlib import Path
+from typing import BinaryIO
 from uuid import uuid4
 
-from fastapi import FastAPI, File, UploadFile
-from fastapi.responses import FileResponse, HTMLResponse, JSONResponse, RedirectResponse
+import orjson
+from fastapi import FastAPI, File, Request, UploadFile
+from fastapi.responses import FileResponse, HTMLResponse, RedirectResponse, Response
 
 import speer_core
 
@@ -15,17 +20,38 @@ BASE_DIR = Path(__file__).resolve().parent
 OUTPUT_DIR = BASE_DIR / "output"
 UPLOAD_DIR = OUTPUT_DIR / "uploads"
 EXPORT_DIR = OUTPUT_DIR / "exports"
+TEXT_CACHE_DIR = OUTPUT_DIR / "text_cache"
 
 ALLOWED_SUFFIXES = {".pdf", ".png", ".jpg", ".jpeg", ".xml"}
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+API_FIELDS = (
+    "file_name",
+    "status",
+    "payment_ready",
+    "total_amount",
+    "iban",
+    "invoice_number",
+)
 
 OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
 UPLOAD_DIR.mkdir(parents=True, exist_ok=True)
 EXPORT_DIR.mkdir(parents=True, exist_ok=True)
+os.environ.setdefault(speer_core.TEXT_CACHE_DIR_ENV, str(TEXT_CACHE_DIR))
 
 app = FastAPI(title="Speer")
 
-latest_records: list[dict] = []
-latest_exports: dict | None = None
+upload_slots = asyncio.Semaphore(os.cpu_count() or 1)
+
+
+@dataclass(frozen=True)
+class RunSnapshot:
+    records: list[dict] = field(default_factory=list)
+    exports: dict = field(default_factory=dict)
+    payload: bytes = b"[]"
+
+
+latest = RunSnapshot()
+export_stamp: tuple[int, str] = (0, "")
 
 
 HTML_PAGE = """
@@ -406,64 +432,113 @@ HTML_PAGE = """
 </body>
 </html>
 """
+HTML_BODY = HTML_PAGE.encode("utf-8")
+HTML_HEADERS = {
+    "Cache-Control": "public, max-age=300",
+    "ETag": f'"{sha256(HTML_BODY).hexdigest()[:16]}"',
+}
 
 
-def _safe_filename(filename: str | None) -> str:
-    if not filename:
-        return "evidence"
-    return Path(filename).name
+def _safe_filename(filename: str | None) -> tuple[str, str]:
+    base = os.path.basename(filename or "") or "evidence"
+    return base, os.path.splitext(base)[1].lower()
 
 
-def _hash_bytes(content: bytes) -> str:
-    hasher = sha256()
-    hasher.update(content)
-    return hasher.hexdigest()
+def _etag_matches(if_none_match: str | None) -> bool:
+    # Weak comparison (RFC 9110 section 13.1.2): ignore W/ prefixes, accept lists and "*".
+    if not if_none_match:
+        return False
+    etag = HTML_HEADERS["ETag"]
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == etag:
+            return True
+    return False
 
 
-def _write_upload(content: bytes, filename: str) -> Path:
-    unique_name = f"{uuid4().hex}_{filename}"
+def _write_all(file_handle: BinaryIO, chunk: memoryview) -> None:
+    while chunk:
+        chunk = chunk[file_handle.write(chunk):]
+
+
+def _hash_and_write(source: BinaryIO, unique_name: str) -> tuple[Path, str]:
     target_path = UPLOAD_DIR / unique_name
-    target_path.write_bytes(content)
-    return target_path
+    hasher = sha256()
+    with target_path.open("wb", buffering=0) as file_handle:
+        # SpooledTemporaryFile only gained readinto() in Python 3.11.
+        if not hasattr(source, "readinto"):
+            while data := source.read(UPLOAD_CHUNK_SIZE):
+                hasher.update(data)
+                _write_all(file_handle, memoryview(data))
+            return target_path, hasher.hexdigest()
+        buffer = memoryview(bytearray(UPLOAD_CHUNK_SIZE))
+        while size := source.readinto(buffer):
+            chunk = buffer[:size]
+            hasher.update(chunk)
+            _write_all(file_handle, chunk)
+    return target_path, hasher.hexdigest()
+
+
+def _api_payload(records: list[dict]) -> bytes:
+    return orjson.dumps([{key: record.get(key) for key in API_FIELDS} for record in records])
+
+
+async def _store_upload(upload: UploadFile, unique_name: str) -> tuple[Path, str]:
+    async with upload_slots:
+        return await asyncio.to_thread(_hash_and_write, upload.file, unique_name)
+
+
+def _export_timestamp() -> str:
+    global export_stamp
+    now = int(time.time())
+    if export_stamp[0] != now:
+        export_stamp = (now, time.strftime("%Y%m%dT%H%M%SZ", time.gmtime(now)))
+    return export_stamp[1]
 
 
 def _export_paths(run_id: str) -> dict:
-    timestamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    timestamp = _export_timestamp()
+    stem = f"speer_{run_id}_{timestamp}"
     return {
-        "xlsx": EXPORT_DIR / f"speer_{run_id}_{timestamp}.xlsx",
-        "json": EXPORT_DIR / f"speer_{run_id}_{timestamp}.json",
-        "ok_xlsx": EXPORT_DIR / f"speer_{run_id}_{timestamp}_payment.xlsx",
-        "review_xlsx": EXPORT_DIR / f"speer_{run_id}_{timestamp}_review.xlsx",
-        "review_json": EXPORT_DIR / f"speer_{run_id}_{timestamp}_review.json",
+        "xlsx": EXPORT_DIR / f"{stem}.xlsx",
+        "json": EXPORT_DIR / f"{stem}.json",
+        "ok_xlsx": EXPORT_DIR / f"{stem}_payment.xlsx",
+        "review_xlsx": EXPORT_DIR / f"{stem}_review.xlsx",
+        "review_json": EXPORT_DIR / f"{stem}_review.json",
     }
 
 
 @app.get("/", response_class=HTMLResponse)
-def index() -> str:
-    return HTML_PAGE
+def index(request: Request) -> Response:
+    if _etag_matches(request.headers.get("if-none-match")):
+        return Response(status_code=304, headers=HTML_HEADERS)
+    return HTMLResponse(HTML_BODY, headers=HTML_HEADERS)
 
 
 @app.post("/upload")
 async def upload(files: list[UploadFile] = File(...)) -> RedirectResponse:
-    global latest_records, latest_exports
+    global latest
 
-    run_id = uuid4().hex[:10]
-    upload_paths: list[Path] = []
+    batch_id = uuid4().hex
+    run_id = batch_id[:10]
+    pending = []
 
-    for upload in files:
-        safe_name = _safe_filename(upload.filename)
-        suffix = Path(safe_name).suffix.lower()
+    for position, upload in enumerate(files):
+        safe_name, suffix = _safe_filename(upload.filename)
 
         if suffix and suffix not in ALLOWED_SUFFIXES:
             suffix = suffix
 
-        content = await upload.read()
-        _hash_bytes(content)
-        file_path = _write_upload(content, safe_name)
-        upload_paths.append(file_path)
+        unique_name = f"{batch_id}_{position:04x}_{safe_name}"
+        pending.append(_store_upload(upload, unique_name))
+
+    written = await asyncio.gather(*pending)
+    upload_paths = [file_path for file_path, _ in written]
+    upload_hashes = [file_hash for _, file_hash in written]
 
     export_paths = _export_paths(run_id)
-    latest_records = speer_core.process_evidence_files(
+    records = await asyncio.to_thread(
+        speer_core.process_evidence_files,
         upload_paths,
         export_paths["xlsx"],
         export_paths["json"],
@@ -471,52 +546,49 @@ async def upload(files: list[UploadFile] = File(...)) -> RedirectResponse:
         export_paths["review_xlsx"],
         export_paths["review_json"],
         run_id,
+        upload_hashes,
+    )
+    latest = RunSnapshot(
+        records=records,
+        exports={key: str(path) for key, path in export_paths.items()},
+        payload=_api_payload(records),
     )
-    latest_exports = {key: str(path) for key, path in export_paths.items()}
 
     return RedirectResponse(url="/", status_code=303)
 
 
 @app.get("/api/invoices")
-def api_invoices() -> JSONResponse:
-    payload = [
-        {
-            "file_name": record.get("file_name"),
-            "status": record.get("status"),
-            "payment_ready": record.get("payment_ready"),
-            "total_amount": record.get("total_amount"),
-            "iban": record.get("iban"),
-            "invoice_number": record.get("invoice_number"),
-        }
-        for record in latest_records
-    ]
-    return JSONResponse(payload)
+def api_invoices() -> Response:
+    return Response(latest.payload, media_type="application/json")
 
 
 @app.get("/download/all")
 def download_all() -> FileResponse:
-    if not latest_exports or not latest_exports.get("xlsx"):
+    exports = latest.exports
+    if not exports.get("xlsx"):
         return HTMLResponse(
             "No export available yet. Upload evidence files first.", status_code=404
         )
-    return FileResponse(latest_exports["xlsx"], filename="speer_invoices.xlsx")
+    return FileResponse(exports["xlsx"], filename="speer_invoices.xlsx")
 
 
 @app.get("/download/payments")
 def download_payments() -> FileResponse:
-    if not latest_exports or not latest_exports.get("ok_xlsx"):
+    exports = latest.exports
+    if not exports.get("ok_xlsx"):
         return HTMLResponse(
             "No payment file available yet. Upload evidence files first.",
             status_code=404,
         )
-    return FileResponse(latest_exports["ok_xlsx"], filename="speer_payments.xlsx")
+    return FileResponse(exports["ok_xlsx"], filename="speer_payments.xlsx")
 
 
 @app.get("/download/review")
 def download_review() -> FileResponse:
-    if not latest_exports or not latest_exports.get("review_xlsx"):
+    exports = latest.exports
+    if not exports.get("review_xlsx"):
         return HTMLResponse(
             "No review file available yet. Upload evidence files first.",
             status_code=404,
         )
-    return FileResponse(latest_exports["review_xlsx"], filename="speer_review.xlsx")
+    return FileResponse(exports["review_xlsx"], filename="speer_review.xlsx")
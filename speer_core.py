@@ -1,12 +1,22 @@
-import json
+import mmap
+import multiprocessing
+import os
 import re
+import tempfile
+import threading
+import time
 import uuid
+from collections import OrderedDict
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from dataclasses import dataclass
 from datetime import datetime, timezone
+from functools import lru_cache
 from hashlib import sha256
 from pathlib import Path
-from typing import Iterable
+from typing import Callable, Iterable
 
+import orjson
 from openpyxl import Workbook
 from pdf2image import convert_from_path
 from PIL import Image
@@ -14,6 +24,65 @@ from pypdf import PdfReader
 import pytesseract
 
 
+TEXT_CACHE_SIZE = 128
+TEXT_CACHE_DIR_ENV = "SPEER_TEXT_CACHE_DIR"
+TEXT_CACHE_SIZE_LIMIT = 1 << 30
+TEXT_CACHE_RESCAN_BYTES = TEXT_CACHE_SIZE_LIMIT // 16
+TEXT_CACHE_TEMP_MAX_AGE = 3600
+# Bump whenever PDF text extraction or OCR output changes (rendering, pypdf/tesseract upgrades).
+TEXT_CACHE_VERSION = 1
+PARALLEL_PARSE_MIN_FILES = 3
+PARSE_POOL_ATTEMPTS = 2
+HASH_CHUNK_SIZE = 4 * 1024 * 1024
+OCR_BATCH_SIZE = 50
+
+INVOICE_NUMBER_PATTERN = re.compile(
+    r"(?:invoice\s*number|invoice\s*no\.?|inv\.\s*no\.?|facture\s*no\.?|rechnungsnummer|rechnung[-\s]*nr\.?|belegnummer|vorgangsnummer)\s*[:#]?\s*([a-z0-9\-/]+)"
+)
+INVOICE_DATE_PATTERN = re.compile(
+    r"(?:invoice\s*date|date|rechnungsdatum)\s*[:#]?\s*([0-9]{4}[-/][0-9]{2}[-/][0-9]{2}|[0-9]{2}[-/][0-9]{2}[-/][0-9]{4}|[0-9]{2}\.[0-9]{2}\.[0-9]{4})"
+)
+TOTAL_AMOUNT_PATTERN = re.compile(
+    r"(?:total\s*amount|amount\s*due|total|gesamtbetrag|rechnungsbetrag|zu\s*zahlen|summe)\s*[:#]?\s*([0-9][0-9\s.,]*)"
+)
+FILENAME_AMOUNT_PATTERN = re.compile(
+    r"([0-9]{1,3}(?:[._][0-9]{3})*(?:,[0-9]{2})|[0-9]+(?:,[0-9]{2})?)"
+)
+IGNORECASE_PATTERNS = {
+    pattern: re.compile(pattern.pattern, re.IGNORECASE)
+    for pattern in (INVOICE_NUMBER_PATTERN, INVOICE_DATE_PATTERN, TOTAL_AMOUNT_PATTERN)
+}
+IBAN_PATTERN = re.compile(r"\b([A-Z]{2}[0-9A-Z\s]{13,34})\b")
+BIC_PATTERN = re.compile(r"\b([A-Z]{6}[A-Z0-9]{2}([A-Z0-9]{3})?)\b")
+IBAN_LENGTHS = {
+    "AD": 24, "AE": 23, "AL": 28, "AT": 20, "AZ": 28, "BA": 20, "BE": 16, "BG": 22,
+    "BH": 22, "BR": 29, "BY": 28, "CH": 21, "CR": 22, "CY": 28, "CZ": 24, "DE": 22,
+    "DK": 18, "DO": 28, "EE": 20, "EG": 29, "ES": 24, "FI": 18, "FO": 18, "FR": 27,
+    "GB": 22, "GE": 22, "GI": 23, "GL": 18, "GR": 27, "GT": 28, "HR": 21, "HU": 28,
+    "IE": 22, "IL": 23, "IQ": 23, "IS": 26, "IT": 27, "JO": 30, "KW": 30, "KZ": 20,
+    "LB": 28, "LC": 32, "LI": 21, "LT": 20, "LU": 20, "LV": 21, "LY": 25, "MC": 27,
+    "MD": 24, "ME": 22, "MK": 19, "MR": 27, "MT": 31, "MU": 30, "NL": 18, "NO": 15,
+    "PK": 24, "PL": 28, "PS": 29, "PT": 25, "QA": 29, "RO": 24, "RS": 22, "SA": 24,
+    "SC": 31, "SE": 24, "SI": 19, "SK": 24, "SM": 27, "ST": 25, "SV": 28, "TL": 23,
+    "TN": 24, "TR": 26, "UA": 29, "VA": 22, "VG": 24, "XK": 20,
+}
+IBAN_LETTER_DIGITS = str.maketrans(
+    {chr(code): str(code - 55) for code in range(ord("A"), ord("Z") + 1)}
+)
+
+_text_cache: OrderedDict[tuple[str, str], str] = OrderedDict()
+_text_cache_lock = threading.Lock()
+# Estimated on-disk cache size, or None until this process has scanned the directory.
+_text_cache_bytes: int | None = None
+_text_cache_written = 0
+_text_cache_size_lock = threading.Lock()
+
+_parse_pool: ProcessPoolExecutor | None = None
+_parse_pool_size = 0
+_render_threads = min(4, os.cpu_count() or 1)
+_parse_pool_lock = threading.Lock()
+
+
 @dataclass(frozen=True)
 class EvidenceRecord:
     file_path: str
@@ -55,25 +124,50 @@ class EvidenceRecord:
 def _file_sha256(file_path: Path) -> str:
     hasher = sha256()
     with file_path.open("rb") as file_handle:
-        for block in iter(lambda: file_handle.read(1024 * 1024), b""):
-            hasher.update(block)
+        if os.fstat(file_handle.fileno()).st_size == 0:
+            return hasher.hexdigest()
+        with mmap.mmap(file_handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            if hasattr(mmap, "MADV_SEQUENTIAL"):
+                mapped.madvise(mmap.MADV_SEQUENTIAL)
+            with memoryview(mapped) as view:
+                for start in range(0, len(view), HASH_CHUNK_SIZE):
+                    hasher.update(view[start : start + HASH_CHUNK_SIZE])
     return hasher.hexdigest()
 
 
+def _pdf_reader_text(reader: PdfReader) -> str:
+    return "\n".join([page.extract_text() or "" for page in reader.pages])
+
+
 def _extract_text_from_pdf(file_path: Path) -> str:
-    reader = PdfReader(str(file_path))
-    pages_text: list[str] = []
-    for page in reader.pages:
-        page_text = page.extract_text() or ""
-        pages_text.append(page_text)
-    return "\n".join(pages_text)
+    with file_path.open("rb") as file_handle:
+        if os.fstat(file_handle.fileno()).st_size == 0:
+            return _pdf_reader_text(PdfReader(file_handle))
+        with mmap.mmap(file_handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            if hasattr(mmap, "MADV_WILLNEED"):
+                mapped.madvise(mmap.MADV_WILLNEED)
+            return _pdf_reader_text(PdfReader(mapped))
 
 
 def _ocr_pdf(file_path: Path) -> str:
-    images = convert_from_path(str(file_path))
     pages_text: list[str] = []
-    for page_image in images:
-        pages_text.append(pytesseract.image_to_string(page_image))
+    with tempfile.TemporaryDirectory(prefix="speer_ocr_") as temp_dir:
+        page_paths = convert_from_path(
+            str(file_path),
+            output_folder=temp_dir,
+            fmt="png",
+            grayscale=True,
+            thread_count=_render_threads,
+            paths_only=True,
+        )
+        list_path = Path(temp_dir) / "pages.txt"
+        for start in range(0, len(page_paths), OCR_BATCH_SIZE):
+            batch = page_paths[start : start + OCR_BATCH_SIZE]
+            list_path.write_text("\n".join(batch) + "\n", encoding="utf-8")
+            *pages, tail = pytesseract.image_to_string(str(list_path)).split("\f")
+            pages_text.extend(page + "\f" for page in pages)
+            if tail:
+                pages_text.append(tail)
     return "\n".join(pages_text)
 
 
@@ -82,11 +176,119 @@ def _ocr_image(file_path: Path) -> str:
     return pytesseract.image_to_string(image)
 
 
-def _first_match(pattern: re.Pattern, text: str) -> str | None:
-    match = pattern.search(text)
+def _text_cache_dir() -> Path | None:
+    # Read from the environment so spawned parse workers inherit the setting.
+    cache_dir = os.environ.get(TEXT_CACHE_DIR_ENV)
+    return Path(cache_dir) if cache_dir else None
+
+
+def _text_cache_path(cache_dir: Path, file_hash: str, method: str) -> Path:
+    return cache_dir / f"{file_hash}.{method}.v{TEXT_CACHE_VERSION}.txt"
+
+
+def _read_stored_text(file_hash: str, method: str) -> str | None:
+    cache_dir = _text_cache_dir()
+    if cache_dir is None:
+        return None
+    cache_path = _text_cache_path(cache_dir, file_hash, method)
+    try:
+        text = cache_path.read_text(encoding="utf-8", errors="surrogatepass")
+        # Pruning evicts by mtime, so touch entries on read to keep it LRU.
+        os.utime(cache_path)
+    except OSError:
+        return None
+    return text
+
+
+def _store_text(file_hash: str, method: str, text: str) -> None:
+    global _text_cache_bytes, _text_cache_written
+    cache_dir = _text_cache_dir()
+    if cache_dir is None:
+        return
+    cache_path = _text_cache_path(cache_dir, file_hash, method)
+    temp_path = cache_path.with_name(f"{cache_path.name}.{uuid.uuid4().hex}.tmp")
+    data = text.encode("utf-8", errors="surrogatepass")
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        temp_path.write_bytes(data)
+        os.replace(temp_path, cache_path)
+    except OSError:
+        temp_path.unlink(missing_ok=True)
+        return
+    with _text_cache_size_lock:
+        _text_cache_written += len(data)
+        # Other processes write too, so rescan periodically rather than trusting the estimate.
+        if (
+            _text_cache_bytes is not None
+            and _text_cache_bytes + _text_cache_written <= TEXT_CACHE_SIZE_LIMIT
+            and _text_cache_written < TEXT_CACHE_RESCAN_BYTES
+        ):
+            return
+        _text_cache_bytes = _prune_text_cache(cache_dir)
+        _text_cache_written = 0
+
+
+def _prune_text_cache(cache_dir: Path) -> int:
+    entries: list[tuple[float, int, Path]] = []
+    total_size = 0
+    stale_before = time.time() - TEXT_CACHE_TEMP_MAX_AGE
+    try:
+        with os.scandir(cache_dir) as scan:
+            for entry in scan:
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                if entry.name.endswith(".tmp"):
+                    # Left behind by a writer that died between write and rename.
+                    if stat.st_mtime < stale_before:
+                        Path(entry.path).unlink(missing_ok=True)
+                    continue
+                if entry.name.endswith(".txt"):
+                    entries.append((stat.st_mtime, stat.st_size, Path(entry.path)))
+                    total_size += stat.st_size
+    except OSError:
+        return total_size
+    if total_size <= TEXT_CACHE_SIZE_LIMIT:
+        return total_size
+    entries.sort()
+    for _, size, cache_path in entries:
+        cache_path.unlink(missing_ok=True)
+        total_size -= size
+        if total_size <= TEXT_CACHE_SIZE_LIMIT:
+            break
+    return total_size
+
+
+def _cached_text(
+    file_hash: str, method: str, extract: Callable[[Path], str], file_path: Path
+) -> str:
+    key = (file_hash, method)
+    with _text_cache_lock:
+        if key in _text_cache:
+            _text_cache.move_to_end(key)
+            return _text_cache[key]
+    text = _read_stored_text(file_hash, method)
+    if text is None:
+        text = extract(file_path)
+        _store_text(file_hash, method, text)
+    with _text_cache_lock:
+        _text_cache[key] = text
+        if len(_text_cache) > TEXT_CACHE_SIZE:
+            _text_cache.popitem(last=False)
+    return text
+
+
+def _first_match(pattern: re.Pattern, text: str, lower_text: str | None) -> str | None:
+    if lower_text is None:
+        match = IGNORECASE_PATTERNS[pattern].search(text)
+        if not match:
+            return None
+        return match.group(1).strip()
+    match = pattern.search(lower_text)
     if not match:
         return None
-    return match.group(1).strip()
+    return text[match.start(1) : match.end(1)].strip()
 
 
 def _normalize_amount(raw_amount: str) -> float | None:
@@ -101,11 +303,9 @@ def _normalize_amount(raw_amount: str) -> float | None:
         return None
 
 
+@lru_cache(maxsize=4096)
 def _amount_from_filename(file_name: str) -> float | None:
-    amount_pattern = re.compile(
-        r"([0-9]{1,3}(?:[._][0-9]{3})*(?:,[0-9]{2})|[0-9]+(?:,[0-9]{2})?)"
-    )
-    match = amount_pattern.search(file_name)
+    match = FILENAME_AMOUNT_PATTERN.search(file_name)
     if not match:
         return None
     return _normalize_amount(match.group(1))
@@ -114,47 +314,38 @@ def _amount_from_filename(file_name: str) -> float | None:
 def _clean_iban(raw_iban: str | None) -> str | None:
     if raw_iban is None:
         return None
-    return re.sub(r"\s+", "", raw_iban)
+    return "".join(raw_iban.split())
 
 
 def _iban_to_int_string(iban: str) -> str:
-    converted = []
-    for char in iban:
-        if char.isdigit():
-            converted.append(char)
-        else:
-            converted.append(str(ord(char) - 55))
-    return "".join(converted)
+    return iban.translate(IBAN_LETTER_DIGITS)
 
 
+@lru_cache(maxsize=4096)
 def _is_valid_iban(iban: str) -> bool:
     if len(iban) < 15 or len(iban) > 34:
         return False
+    if len(iban) != IBAN_LENGTHS.get(iban[:2], len(iban)):
+        return False
     if not iban[:2].isalpha():
         return False
     if not iban[2:].isalnum():
         return False
     rearranged = iban[4:] + iban[:4]
-    numeric = _iban_to_int_string(rearranged)
-    remainder = 0
-    for digit in numeric:
-        remainder = (remainder * 10 + int(digit)) % 97
-    return remainder == 1
+    return int(_iban_to_int_string(rearranged)) % 97 == 1
 
 
-def _select_iban(text: str) -> str | None:
-    iban_pattern = re.compile(r"\b([A-Z]{2}[0-9A-Z\s]{13,34})\b")
-    for match in iban_pattern.findall(text.upper()):
+def _select_iban(upper_text: str) -> str | None:
+    for match in IBAN_PATTERN.findall(upper_text):
         candidate = _clean_iban(match)
         if candidate and _is_valid_iban(candidate):
             return candidate
     return None
 
 
-def _select_bic(text: str) -> str | None:
-    bic_pattern = re.compile(r"\b([A-Z]{6}[A-Z0-9]{2}([A-Z0-9]{3})?)\b")
+def _select_bic(upper_text: str) -> str | None:
     banned = {"DESCRIPTION", "SECURITY"}
-    for match in bic_pattern.findall(text.upper()):
+    for match in BIC_PATTERN.findall(upper_text):
         candidate = match[0]
         if candidate in banned:
             continue
@@ -198,30 +389,20 @@ def _suggested_action(parse_errors: Iterable[str]) -> str:
 def _parse_fields(text: str, file_path: Path) -> tuple[dict, list[str]]:
     parse_errors: list[str] = []
 
-    invoice_number_pattern = re.compile(
-        r"(?:invoice\s*number|invoice\s*no\.?|inv\.\s*no\.?|facture\s*no\.?|rechnungsnummer|rechnung[-\s]*nr\.?|belegnummer|vorgangsnummer)\s*[:#]?\s*([A-Z0-9\-/]+)",
-        re.IGNORECASE,
-    )
-    invoice_date_pattern = re.compile(
-        r"(?:invoice\s*date|date|rechnungsdatum)\s*[:#]?\s*([0-9]{4}[-/][0-9]{2}[-/][0-9]{2}|[0-9]{2}[-/][0-9]{2}[-/][0-9]{4}|[0-9]{2}\.[0-9]{2}\.[0-9]{4})",
-        re.IGNORECASE,
-    )
-    total_amount_pattern = re.compile(
-        r"(?:total\s*amount|amount\s*due|total|gesamtbetrag|rechnungsbetrag|zu\s*zahlen|summe)\s*[:#]?\s*([0-9][0-9\s.,]*)",
-        re.IGNORECASE,
-    )
-
-    invoice_number = _first_match(invoice_number_pattern, text)
-    invoice_date = _first_match(invoice_date_pattern, text)
-    raw_amount = _first_match(total_amount_pattern, text)
+    # str.lower() doesn't case-fold like IGNORECASE outside ASCII (e.g. U+017F, U+0131).
+    lower_text = text.lower() if text.isascii() else None
+    invoice_number = _first_match(INVOICE_NUMBER_PATTERN, text, lower_text)
+    invoice_date = _first_match(INVOICE_DATE_PATTERN, text, lower_text)
+    raw_amount = _first_match(TOTAL_AMOUNT_PATTERN, text, lower_text)
 
     currency = "EUR"
 
-    iban = _select_iban(text)
+    upper_text = text.upper()
+    iban = _select_iban(upper_text)
     if iban is None:
         parse_errors.append("iban_missing_or_invalid")
 
-    bic = _select_bic(text)
+    bic = _select_bic(upper_text)
 
     total_amount = None
     if raw_amount:
@@ -264,6 +445,7 @@ def _build_record(
     text: str,
     fields: dict,
     parse_errors: list[str],
+    file_hash: str | None = None,
 ) -> EvidenceRecord:
     total_amount = fields.get("total_amount")
     iban = fields.get("iban")
@@ -275,7 +457,7 @@ def _build_record(
     return EvidenceRecord(
         file_path=str(file_path),
         file_name=file_path.name,
-        sha256=_file_sha256(file_path),
+        sha256=file_hash or _file_sha256(file_path),
         evidence_type=evidence_type,
         extraction_method=extraction_method,
         text_preview=text[:1200],
@@ -291,9 +473,10 @@ def _build_record(
     )
 
 
-def parse_pdf(file_path: Path) -> EvidenceRecord:
+def parse_pdf(file_path: Path, file_hash: str | None = None) -> EvidenceRecord:
+    file_hash = file_hash or _file_sha256(file_path)
     try:
-        text = _extract_text_from_pdf(file_path)
+        text = _cached_text(file_hash, "pdf_text", _extract_text_from_pdf, file_path)
     except Exception as exc:  # noqa: BLE001
         return _build_record(
             file_path,
@@ -309,11 +492,12 @@ def parse_pdf(file_path: Path) -> EvidenceRecord:
                 "bic": None,
             },
             parse_errors=[f"pdf_read_error:{exc}"],
+            file_hash=file_hash,
         )
 
     if len(text.strip()) < 40:
         try:
-            ocr_text = _ocr_pdf(file_path)
+            ocr_text = _cached_text(file_hash, "ocr_pdf", _ocr_pdf, file_path)
         except Exception as exc:  # noqa: BLE001
             fields, errors = _parse_fields(text, file_path)
             errors.append(f"ocr_error:{exc}")
@@ -324,6 +508,7 @@ def parse_pdf(file_path: Path) -> EvidenceRecord:
                 text=text,
                 fields=fields,
                 parse_errors=errors,
+                file_hash=file_hash,
             )
 
         fields, errors = _parse_fields(ocr_text, file_path)
@@ -334,6 +519,7 @@ def parse_pdf(file_path: Path) -> EvidenceRecord:
             text=ocr_text,
             fields=fields,
             parse_errors=errors,
+            file_hash=file_hash,
         )
 
     fields, errors = _parse_fields(text, file_path)
@@ -344,12 +530,14 @@ def parse_pdf(file_path: Path) -> EvidenceRecord:
         text=text,
         fields=fields,
         parse_errors=errors,
+        file_hash=file_hash,
     )
 
 
-def parse_image(file_path: Path) -> EvidenceRecord:
+def parse_image(file_path: Path, file_hash: str | None = None) -> EvidenceRecord:
+    file_hash = file_hash or _file_sha256(file_path)
     try:
-        text = _ocr_image(file_path)
+        text = _cached_text(file_hash, "ocr_image", _ocr_image, file_path)
     except Exception as exc:  # noqa: BLE001
         return _build_record(
             file_path,
@@ -365,6 +553,7 @@ def parse_image(file_path: Path) -> EvidenceRecord:
                 "bic": None,
             },
             parse_errors=[f"ocr_error:{exc}"],
+            file_hash=file_hash,
         )
 
     fields, errors = _parse_fields(text, file_path)
@@ -375,10 +564,11 @@ def parse_image(file_path: Path) -> EvidenceRecord:
         text=text,
         fields=fields,
         parse_errors=errors,
+        file_hash=file_hash,
     )
 
 
-def parse_xml(file_path: Path) -> EvidenceRecord:
+def parse_xml(file_path: Path, file_hash: str | None = None) -> EvidenceRecord:
     return _build_record(
         file_path,
         evidence_type="xml",
@@ -393,17 +583,18 @@ def parse_xml(file_path: Path) -> EvidenceRecord:
             "bic": None,
         },
         parse_errors=["xml_parsing_not_implemented"],
+        file_hash=file_hash,
     )
 
 
-def detect_and_parse(file_path: Path) -> EvidenceRecord:
+def detect_and_parse(file_path: Path, file_hash: str | None = None) -> EvidenceRecord:
     suffix = file_path.suffix.lower()
     if suffix == ".pdf":
-        return parse_pdf(file_path)
+        return parse_pdf(file_path, file_hash)
     if suffix in {".png", ".jpg", ".jpeg"}:
-        return parse_image(file_path)
+        return parse_image(file_path, file_hash)
     if suffix == ".xml":
-        return parse_xml(file_path)
+        return parse_xml(file_path, file_hash)
 
     return _build_record(
         file_path,
@@ -419,6 +610,7 @@ def detect_and_parse(file_path: Path) -> EvidenceRecord:
             "bic": None,
         },
         parse_errors=[f"unsupported_format:{suffix or 'unknown'}"],
+        file_hash=file_hash,
     )
 
 
@@ -427,17 +619,132 @@ def process_invoice(file_path: str | Path) -> dict:
     return record.to_dict()
 
 
-def parse_invoice_files(file_paths: Iterable[Path]) -> list[EvidenceRecord]:
+def _init_parse_worker() -> None:
+    global _render_threads
+    os.environ.setdefault("OMP_THREAD_LIMIT", "1")
+    _render_threads = 1
+
+
+def _new_parse_pool(max_workers: int) -> ProcessPoolExecutor:
+    return ProcessPoolExecutor(
+        max_workers=max_workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_parse_worker,
+    )
+
+
+def _submit_parse_futures(
+    pool: ProcessPoolExecutor, paths: list[Path], hashes: list[str | None]
+) -> list[Future]:
+    return [
+        pool.submit(detect_and_parse, file_path, file_hash)
+        for file_path, file_hash in zip(paths, hashes, strict=True)
+    ]
+
+
+def _worker_crash_record(file_path: Path, file_hash: str | None) -> EvidenceRecord:
+    return _build_record(
+        file_path,
+        evidence_type="unknown",
+        extraction_method="unknown",
+        text="",
+        fields={
+            "invoice_number": None,
+            "invoice_date": None,
+            "total_amount": None,
+            "currency": "EUR",
+            "iban": None,
+            "bic": None,
+        },
+        parse_errors=["parse_worker_crashed"],
+        file_hash=file_hash,
+    )
+
+
+def _submit_parse_batch(
+    max_workers: int, paths: list[Path], hashes: list[str | None]
+) -> tuple[ProcessPoolExecutor, list[Future]]:
+    global _parse_pool, _parse_pool_size
+    # Submit under the lock so a concurrent resize can't shut the pool down first.
+    with _parse_pool_lock:
+        if _parse_pool is None or _parse_pool_size != max_workers:
+            if _parse_pool is not None:
+                # Batches already submitted to the old pool still run to completion.
+                _parse_pool.shutdown(wait=False)
+            _parse_pool = _new_parse_pool(max_workers)
+            _parse_pool_size = max_workers
+        try:
+            return _parse_pool, _submit_parse_futures(_parse_pool, paths, hashes)
+        except BrokenProcessPool:
+            # A worker died while the pool sat idle; start over with a fresh one.
+            _parse_pool.shutdown(wait=False, cancel_futures=True)
+            _parse_pool = _new_parse_pool(max_workers)
+            return _parse_pool, _submit_parse_futures(_parse_pool, paths, hashes)
+
+
+def _discard_parse_pool(pool: ProcessPoolExecutor) -> None:
+    global _parse_pool
+    with _parse_pool_lock:
+        if _parse_pool is pool:
+            _parse_pool = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _parse_in_pool(
+    max_workers: int, paths: list[Path], hashes: list[str | None]
+) -> list[EvidenceRecord]:
+    records: list[EvidenceRecord | None] = [None] * len(paths)
+    pending = list(range(len(paths)))
+    for _ in range(PARSE_POOL_ATTEMPTS):
+        pool, futures = _submit_parse_batch(
+            max_workers,
+            [paths[index] for index in pending],
+            [hashes[index] for index in pending],
+        )
+        unfinished: list[int] = []
+        for index, future in zip(pending, futures):
+            try:
+                records[index] = future.result()
+            except BrokenProcessPool:
+                unfinished.append(index)
+        if not unfinished:
+            break
+        # A worker died (e.g. OOM-killed); retry what it took down in a fresh pool.
+        _discard_parse_pool(pool)
+        pending = unfinished
+    else:
+        # Never parse in the calling process: the file that killed the worker
+        # would take the caller (e.g. the web server) down with it.
+        for index in pending:
+            records[index] = _worker_crash_record(paths[index], hashes[index])
+    return records
+
+
+def parse_invoice_files(
+    file_paths: Iterable[Path],
+    file_hashes: Iterable[str] | None = None,
+    max_workers: int | None = None,
+) -> list[EvidenceRecord]:
+    paths = list(file_paths)
+    hashes = list(file_hashes) if file_hashes is not None else [None] * len(paths)
+    if len(hashes) != len(paths):
+        raise ValueError(
+            f"file_hashes has {len(hashes)} entries for {len(paths)} files"
+        )
+    if max_workers is not None and max_workers < 1:
+        raise ValueError(f"max_workers must be at least 1, got {max_workers}")
+    workers = max_workers or os.cpu_count() or 1
+    if workers >= 2 and len(paths) >= PARALLEL_PARSE_MIN_FILES:
+        return _parse_in_pool(workers, paths, hashes)
     records: list[EvidenceRecord] = []
-    for file_path in file_paths:
-        records.append(detect_and_parse(file_path))
+    for file_path, file_hash in zip(paths, hashes, strict=True):
+        records.append(detect_and_parse(file_path, file_hash))
     return records
 
 
 def export_xlsx(records: Iterable[EvidenceRecord], output_path: Path) -> None:
-    workbook = Workbook()
-    worksheet = workbook.active
-    worksheet.title = "speer_evidence"
+    workbook = Workbook(write_only=True)
+    worksheet = workbook.create_sheet("speer_evidence")
 
     headers = [
         "file_path",
@@ -481,9 +788,8 @@ def export_xlsx(records: Iterable[EvidenceRecord], output_path: Path) -> None:
 
 
 def export_payment_instructions(records: Iterable[EvidenceRecord], output_path: Path) -> None:
-    workbook = Workbook()
-    worksheet = workbook.active
-    worksheet.title = "payment_instructions"
+    workbook = Workbook(write_only=True)
+    worksheet = workbook.create_sheet("payment_instructions")
 
     headers = [
         "beneficiary_name",
@@ -518,9 +824,8 @@ def export_payment_instructions(records: Iterable[EvidenceRecord], output_path:
 
 
 def export_review_pack(records: Iterable[EvidenceRecord], output_path: Path) -> None:
-    workbook = Workbook()
-    worksheet = workbook.active
-    worksheet.title = "review"
+    workbook = Workbook(write_only=True)
+    worksheet = workbook.create_sheet("review")
 
     headers = [
         "file_name",
@@ -557,34 +862,36 @@ def export_review_pack(records: Iterable[EvidenceRecord], output_path: Path) ->
     workbook.save(output_path)
 
 
-def export_json_audit(records: Iterable[EvidenceRecord], output_path: Path, run_id: str) -> dict:
-    timestamp = datetime.now(timezone.utc).isoformat()
+def _write_json_records(
+    record_dicts: list[dict],
+    output_path: Path,
+    run_id: str,
+    timestamp: str | None = None,
+) -> dict:
+    timestamp = timestamp or datetime.now(timezone.utc).isoformat()
     payload = {
         "run_id": run_id,
         "timestamp": timestamp,
-        "records": [record.to_dict() for record in records],
+        "records": record_dicts,
     }
 
-    with output_path.open("w", encoding="utf-8") as file_handle:
-        json.dump(payload, file_handle, indent=2, ensure_ascii=False)
+    output_path.write_bytes(orjson.dumps(payload, option=orjson.OPT_INDENT_2))
 
     return payload
 
 
-def export_review_json(records: Iterable[EvidenceRecord], output_path: Path, run_id: str) -> dict:
-    timestamp = datetime.now(timezone.utc).isoformat()
-    payload = {
-        "run_id": run_id,
-        "timestamp": timestamp,
-        "records": [
-            record.to_dict() for record in records if record.status == "needs_review"
-        ],
-    }
+def export_json_audit(records: Iterable[EvidenceRecord], output_path: Path, run_id: str) -> dict:
+    return _write_json_records(
+        [record.to_dict() for record in records], output_path, run_id
+    )
 
-    with output_path.open("w", encoding="utf-8") as file_handle:
-        json.dump(payload, file_handle, indent=2, ensure_ascii=False)
 
-    return payload
+def export_review_json(records: Iterable[EvidenceRecord], output_path: Path, run_id: str) -> dict:
+    return _write_json_records(
+        [record.to_dict() for record in records if record.status == "needs_review"],
+        output_path,
+        run_id,
+    )
 
 
 def export_outputs(
@@ -597,11 +904,39 @@ def export_outputs(
     run_id: str | None = None,
 ) -> dict:
     resolved_run_id = run_id or str(uuid.uuid4())
-    export_xlsx(records, Path(xlsx_output_path))
-    export_payment_instructions(records, Path(ok_xlsx_output_path))
-    export_review_pack(records, Path(review_xlsx_output_path))
-    export_json_audit(records, Path(json_output_path), resolved_run_id)
-    export_review_json(records, Path(review_json_output_path), resolved_run_id)
+    timestamp = datetime.now(timezone.utc).isoformat()
+    records = list(records)
+    record_dicts: list[dict] = []
+    review_dicts: list[dict] = []
+    for record in records:
+        record_dict = record.to_dict()
+        record_dicts.append(record_dict)
+        if record.status == "needs_review":
+            review_dicts.append(record_dict)
+    with ThreadPoolExecutor(max_workers=5) as executor:
+        futures = [
+            executor.submit(export_xlsx, records, Path(xlsx_output_path)),
+            executor.submit(
+                export_payment_instructions, records, Path(ok_xlsx_output_path)
+            ),
+            executor.submit(export_review_pack, records, Path(review_xlsx_output_path)),
+            executor.submit(
+                _write_json_records,
+                record_dicts,
+                Path(json_output_path),
+                resolved_run_id,
+                timestamp,
+            ),
+            executor.submit(
+                _write_json_records,
+                review_dicts,
+                Path(review_json_output_path),
+                resolved_run_id,
+                timestamp,
+            ),
+        ]
+        for future in futures:
+            future.result()
 
     return {
         "run_id": resolved_run_id,
@@ -621,9 +956,11 @@ def process_evidence_files(
     review_xlsx_output_path: str | Path,
     review_json_output_path: str | Path,
     run_id: str | None = None,
+    file_hashes: Iterable[str] | None = None,
+    max_workers: int | None = None,
 ) -> list[dict]:
     resolved_paths = [Path(path).expanduser().resolve() for path in file_paths]
-    records = parse_invoice_files(resolved_paths)
+    records = parse_invoice_files(resolved_paths, file_hashes, max_workers)
     export_outputs(
         records,
         xlsx_output_path,
@@ -657,7 +994,20 @@ if __name__ == "__main__":
         help="Output JSON path for needs_review invoices",
     )
     parser.add_argument("--run-id", help="Run ID for audit log")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        help="Parser processes, at least 1; 1 parses serially (default: CPU count)",
+    )
+    parser.add_argument(
+        "--text-cache",
+        help=f"Directory for cached extracted text (default: ${TEXT_CACHE_DIR_ENV}, else off)",
+    )
     args = parser.parse_args()
+    if args.workers is not None and args.workers < 1:
+        parser.error("--workers must be at least 1")
+    if args.text_cache:
+        os.environ[TEXT_CACHE_DIR_ENV] = args.text_cache
 
     process_evidence_files(
         args.inputs,
@@ -667,4 +1017,5 @@ if __name__ == "__main__":
         args.review_xlsx,
         args.review_json,
         args.run_id,
+        max_workers=args.workers,
     )